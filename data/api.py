@@ -1,14 +1,28 @@
-from flask import Flask, jsonify, request
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 import os
-from flask_cors import CORS
-from data_processor import StockDataProcessor
-import json
+import sys
+import orjson
+from data_processor import StockDataProcessor, TIMEFRAMES
 
-#To initialize flask app
-app = Flask(__name__)
+#To initialize the ASGI app
+app = FastAPI()
 ''' Used to perform enable cross-origin resource sharing to allow requests from
 React file for api endpoints.'''
-CORS(app)
+app.add_middleware(CORSMiddleware, allow_origins=['*'], allow_methods=['GET'], allow_headers=['*'])
+# ~~~~~~ Main Part: Running the ASGI App ~~~~~~~
+"""Here, the app is served by Uvicorn at port 5000 with 4 worker processes.
+    Uvicorn picks up uvloop and httptools automatically when they are installed.
+        The equivalent command line is:
+            uvicorn api:app --port 5000 --workers 4 --loop uvloop --http httptools
+    The launcher is replaced by the uvicorn command itself before anything below runs,
+        so only the worker processes build the data (spawned workers would otherwise
+        re-run this script as well)."""
+if __name__ == "__main__":
+    os.execv(sys.executable, [sys.executable, '-m', 'uvicorn', 'api:app', '--app-dir', os.path.dirname(os.path.abspath(__file__)),
+                              '--port', '5000', '--workers', '4'])
+
 # ~~~~~~~~ Initializing Data Processor ~~~~~~~~~~
 # to avoid any trouble while data reloading and reviewing while requesting
 print("Starting the server... Please wait it's not too long!")
@@ -22,41 +36,46 @@ except FileNotFoundError:
     print(f"MASSIVE ERROR: the data file {csv_path} was not found. Please ensure the file path is correct.")
     exit()
 
-# ~~~~~~~ Initializing API Endpoints ~~~~~~~~
-@app.route('/api/stock/summary', methods=['GET'])
-def get_stock_summary():
+# orjson encodes the NaN gaps left by resampling as null instead of failing,
+# and serializes numpy arrays and scalars natively.
+def _encode(content):
+    return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def _json(body, status_code=200):
+    return Response(body, status_code=status_code, media_type='application/json')
+
+# ~~~~~~~ Pre-encoding Responses ~~~~~~~
+# the processed data never changes, so every response body is encoded once here
+# and the endpoints only send the cached bytes.
+summary_json = _encode(processor.get_summary())
+timeseries_json = {tf: _encode(processor.get_timeseries_data(tf)) for tf in TIMEFRAMES}
+orderbook_json = _encode(processor.get_orderbook_analysis())
+indicators_json = _encode(processor.get_technical_indicators())
+invalid_timeframe_json = _encode({"error": f"Invalid timeframe. Allowed values: {TIMEFRAMES}"})
+
+# ~~~~~~~ Initializing API Endpoints ~~~~~~~
+@app.get('/api/stock/summary')
+async def get_stock_summary():
     # this will return statistics and data from the data file
-    summary_data = processor.get_summary()
-    return jsonify(summary_data)
+    return _json(summary_json)
 
 # this will return the data for the specified timeframe.
 # for timeframes = 1min, 5min, 15min
-@app.route('/api/stock/timeseries/<timeframe>', methods=['GET'])
-def get_timeseries_data(timeframe):
-    allowed_timeframes = ['1Min', '5Min', '15Min', '1H']
-    if timeframe not in allowed_timeframes:
-        return jsonify({"error": f"Invalid timeframe. Allowed values: {allowed_timeframes}"}), 400
+@app.get('/api/stock/timeseries/{timeframe}')
+async def get_timeseries_data(timeframe: str):
+    if timeframe not in timeseries_json:
+        return _json(invalid_timeframe_json, status_code=400)
             
-    timeseries_data = processor.get_timeseries_data(timeframe)
-    return jsonify(timeseries_data)
+    return _json(timeseries_json[timeframe])
 
 # API Endpoint to return order book analysis.
-@app.route('/api/stock/orderbook', methods=['GET'])
-def get_orderbook_analysis():
-    orderbook_data = processor.get_orderbook_analysis()
-    return jsonify(orderbook_data)
+@app.get('/api/stock/orderbook')
+async def get_orderbook_analysis():
+    return _json(orderbook_json)
 
 # Endpoint to return calculated technical indicators in different timeframes
-@app.route('/api/stock/indicators', methods=['GET'])
-def get_technical_indicators():
-    indicators_data = processor.get_technical_indicators()
-    return jsonify(indicators_data)
-
-# ~~~~~~ Main Part: Running the Flask App ~~~~~~~
-"""Here, fask app will run at port 5000 and 
-    debug=True indicates that server will be automatically reloaded if the 
-        code changes while live streaming the app."""
-if __name__ == "__main__":
-    app.run(debug=True, port=5000)
+@app.get('/api/stock/indicators')
+async def get_technical_indicators():
+    return _json(indicators_json)
     
 ## COMPLETED 
\ No newline at end of file
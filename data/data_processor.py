@@ -1,5 +1,18 @@
 import pandas as pd
 import numpy as np
+import glob
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from indicator_kernels import fused_rolling, rsi_ewm
+
+# Timeframes whose OHLCV views are precomputed at start-up.
+TIMEFRAMES = ['1Min', '5Min', '15Min', '1H']
+DAY_NS = 86400 * 10**9
+# Bump whenever the processing pipeline changes, so stale on-disk caches are ignored.
+CACHE_VERSION = 1
 
 class StockDataProcessor:
     """
@@ -13,23 +26,144 @@ class StockDataProcessor:
             csv_path (str): The path to the stock data CSV file.
         """
         print("Initializing data processing...")
-        self.data = self._load_data(csv_path)
-        self._clean_data()
-        self._calculate_technical_indicators()
-        self._perform_statistical_analysis()
+        # Processed data is cached on disk next to the CSV, keyed by its path, mtime and size,
+        # so a server restart skips the whole pipeline while the CSV is unchanged.
+        cache_path = self._cache_path(csv_path)
+        if not self._load_cache(cache_path):
+            # Tick data is kept as a structure of arrays: one datetime64 array of
+            # timestamps plus a dict of contiguous numeric column arrays.
+            self.ts, self.arr = self._load_data(csv_path)
+            self._clean_data()
+            self._calculate_technical_indicators()
+            # Drop the leading NaN rows left by cleaning and the indicator warm-up in one pass
+            keep = np.flatnonzero(self._valid_mask)
+            self.ts = self.ts[keep]
+            # int64 nanoseconds since the epoch (a zero-copy view) for bucket arithmetic
+            self.ts_ns = self.ts.view(np.int64)
+            self.arr = {col: values[keep] for col, values in self.arr.items()}
+            self._perform_statistical_analysis()
+            self._save_cache(cache_path, csv_path)
+        self._build_caches()
         print("Data processing complete.")
         
+    @staticmethod
+    def _cache_prefix(csv_path):
+        """Returns the path prefix shared by every on-disk cache file of one CSV."""
+        csv_path = os.path.abspath(csv_path)
+        path_key = hashlib.md5(csv_path.encode()).hexdigest()[:12]
+        return os.path.join(os.path.dirname(csv_path), f".cache_{path_key}_")
+
+    @classmethod
+    def _cache_path(cls, csv_path):
+        """Returns the on-disk cache path (without extension) for the CSV's current version."""
+        stat = os.stat(csv_path)
+        key = hashlib.md5(f"{CACHE_VERSION}-{os.path.abspath(csv_path)}-{stat.st_mtime}-{stat.st_size}".encode()).hexdigest()
+        return cls._cache_prefix(csv_path) + key
+
+    def _load_cache(self, cache_path):
+        """
+        Restores the processed arrays and statistics from the on-disk cache.
+        Returns False when there is no usable cache; an unreadable one is deleted
+        so the caller falls back to the full pipeline.
+        """
+        if not (os.path.exists(cache_path + '.parquet') and os.path.exists(cache_path + '.json')):
+            return False
+        print(f"Loading processed data from cache {cache_path}...")
+        try:
+            df = pd.read_parquet(cache_path + '.parquet')
+            self.ts = df.pop('timestamp').to_numpy(dtype='datetime64[ns]')
+            self.ts_ns = self.ts.view(np.int64)
+            self.arr = {col: np.ascontiguousarray(df[col].to_numpy()) for col in df.columns}
+            with open(cache_path + '.json') as f:
+                cached = json.load(f)
+            self.summary = cached['summary']
+            self.correlation_matrix = pd.DataFrame(cached['correlation_matrix'])
+        # pyarrow's ArrowInvalid and json's JSONDecodeError are both ValueErrors
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Warning: discarding unreadable processed data cache: {e}")
+            for path in (cache_path + '.parquet', cache_path + '.json'):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            return False
+        return True
+
+    @staticmethod
+    def _replace_atomically(path, write):
+        """
+        Writes a file through a private temp file that is then moved into place, so
+        concurrent writers never share a file and readers never see a partial one.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                                        prefix=os.path.basename(path) + '.', suffix='.tmp')
+        os.close(fd)
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _save_cache(self, cache_path, csv_path):
+        """Writes the processed arrays and statistics to the on-disk cache."""
+        def write_json(path):
+            with open(path, 'w') as f:
+                json.dump({
+                    'summary': {k: float(v) for k, v in self.summary.items()},
+                    'correlation_matrix': self.correlation_matrix.to_dict()
+                }, f)
+
+        def write_parquet(path):
+            pd.DataFrame({'timestamp': self.ts, **self.arr}).to_parquet(path, index=False)
+
+        try:
+            # Remove caches left behind by earlier versions of this CSV only
+            for stale in glob.glob(self._cache_prefix(csv_path) + '*'):
+                if not stale.startswith(cache_path):
+                    os.remove(stale)
+            # The parquet file is moved into place last; readers need both files
+            self._replace_atomically(cache_path + '.json', write_json)
+            self._replace_atomically(cache_path + '.parquet', write_parquet)
+        except (OSError, ValueError) as e:
+            # The cache is only an optimization; carry on without it
+            print(f"Warning: could not write the processed data cache: {e}")
+
     def _load_data(self, csv_path):
-        """Loads data, creates a timestamp, renames columns, and sets the index.
+        """Loads data, creates a timestamp, renames columns, and splits it into arrays.
     This is a robust and highly compatible version with added debugging.
     """
+        # Define the column mapping
+        column_mapping = {
+        'ltp': 'last_price',
+        'l1_bid_vwap': 'buy_price',
+        'l1_ask_vwap': 'sell_price',
+        'l1_bid_vol': 'buy_quantity',
+        'l1_ask_vol': 'sell_quantity',
+        'volume': 'total_traded_volume'
+        }
         print(f"Loading data from {csv_path}...")
-        df = pd.read_csv(csv_path)
+        # Read only the header first so the full read can skip the unused metric columns
+        # (including the extra unnamed column from the CSV starting with a comma)
+        csv_columns = pd.read_csv(csv_path, nrows=0).columns.tolist()
         # Debug: Print columns to verify presence of required columns
-        print("Columns in CSV:", df.columns.tolist())
-        # Drop the extra unnamed column if it exists (from the CSV starting with a comma)
-        if 'Unnamed: 0' in df.columns:
-            df.drop('Unnamed: 0', axis=1, inplace=True)
+        print("Columns in CSV:", csv_columns)
+        # Explicit dtypes let the multithreaded pyarrow reader parse numerics directly
+        column_dtypes = {'start_date': str, 'start_time': 'float64'}
+        column_dtypes.update({col: 'float32' for col in column_mapping})
+        usecols = [col for col in column_dtypes if col in csv_columns]
+        try:
+            df = pd.read_csv(csv_path, engine='pyarrow', usecols=usecols,
+                             dtype={col: column_dtypes[col] for col in usecols})
+        except ValueError:
+            # Some numeric fields are malformed: read the columns untyped and coerce
+            # the bad values to NaN in a single block conversion
+            print("Warning: non-numeric values found in numeric columns, coercing them to NaN.")
+            df = pd.read_csv(csv_path, engine='pyarrow', usecols=usecols,
+                             dtype={col: str for col in ['start_date'] if col in usecols})
+            numeric_src = [col for col in column_mapping if col in usecols]
+            df[numeric_src] = df[numeric_src].apply(pd.to_numeric, errors='coerce').astype(np.float32)
         # Check if 'start_date' and 'start_time' columns exist
         if 'start_time' not in df.columns:
             raise KeyError("CSV file must contain 'start_time' column.")
@@ -41,62 +175,41 @@ class StockDataProcessor:
         # Replace zero or invalid dates with default date
             df['start_date'] = df['start_date'].astype(str).str.strip()
             df.loc[(df['start_date'] == '0') | (df['start_date'].isna()) | (df['start_date'] == ''), 'start_date'] = '2023-01-01'
-        # Function to convert numeric HHMMSS to timedelta
-        def hhmmss_to_timedelta(hhmmss):
-            try:
-                hhmmss_int = int(float(hhmmss))  # handle floats like 91401.9999
-            except:
-                return pd.NaT
-            hours = hhmmss_int // 10000
-            minutes = (hhmmss_int % 10000) // 100
-            seconds = hhmmss_int % 100
-            return pd.Timedelta(hours=hours, minutes=minutes, seconds=seconds)
-        # Convert 'start_time' to timedelta
-        df['start_time_timedelta'] = df['start_time'].map(hhmmss_to_timedelta)
+        # Convert numeric HHMMSS to timedelta with vectorized integer arithmetic
+        hhmmss = pd.to_numeric(df['start_time'], errors='coerce').to_numpy(dtype=float)
+        invalid_time = ~np.isfinite(hhmmss)
+        hhmmss_int = np.where(invalid_time, 0, hhmmss).astype(np.int64)  # truncates floats like 91401.9999
+        hours = hhmmss_int // 10000
+        minutes = (hhmmss_int % 10000) // 100
+        seconds = hhmmss_int % 100
+        start_time_timedelta = (hours * 3600 + minutes * 60 + seconds).astype('timedelta64[s]')
+        start_time_timedelta[invalid_time] = np.timedelta64('NaT')
             
-        # Drop rows with invalid time conversion
-        invalid_time_count = df['start_time_timedelta'].isna().sum()
+        # Rows with invalid time conversion are dropped below
+        invalid_time_count = int(invalid_time.sum())
         if invalid_time_count > 0:
             print(f"Warning: Dropping {invalid_time_count} rows due to invalid 'start_time' format.")
-            df.dropna(subset=['start_time_timedelta'], inplace=True)
         
-        # Combine 'start_date' and 'start_time_timedelta' into a single datetime column
-        df['timestamp'] = pd.to_datetime(df['start_date'], errors='coerce') + df['start_time_timedelta']
-        # Drop rows with invalid timestamps
-        invalid_timestamp_count = df['timestamp'].isna().sum()
+        # Combine 'start_date' and 'start_time_timedelta' into a single datetime array
+        start_date = pd.to_datetime(df['start_date'], errors='coerce').to_numpy(dtype='datetime64[ns]')
+        timestamps = start_date + start_time_timedelta
+        # Rows with invalid timestamps are dropped below as well
+        invalid_timestamp = np.isnat(timestamps)
+        invalid_timestamp_count = int(invalid_timestamp.sum()) - invalid_time_count
         if invalid_timestamp_count > 0:
             print(f"Warning: Dropping {invalid_timestamp_count} rows due to invalid combined timestamp.")
-            df.dropna(subset=['timestamp'], inplace=True)
-        if df.empty:
+        keep = np.flatnonzero(~invalid_timestamp)
+        if keep.size == 0:
             raise ValueError("No valid timestamps found after processing 'start_date' and 'start_time'.")
         
-        # Define the column mapping
-        column_mapping = {
-        'ltp': 'last_price',
-        'l1_bid_vwap': 'buy_price',
-        'l1_ask_vwap': 'sell_price',
-        'l1_bid_vol': 'buy_quantity',
-        'l1_ask_vol': 'sell_quantity',
-        'volume': 'total_traded_volume'
-        }
-        df.rename(columns=column_mapping, inplace=True)
-        # Select only the columns we need
-        required_columns = [
-            'timestamp', 'last_price', 'buy_price', 'sell_price',
-            'buy_quantity', 'sell_quantity', 'total_traded_volume'
-        ]
-        df = df[required_columns].copy()
-        # Ensure all key columns are numeric
-        numeric_cols = [
-        'last_price', 'buy_price', 'sell_price',
-        'buy_quantity', 'sell_quantity', 'total_traded_volume'
-        ]
-        for col in numeric_cols:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-        # Set the timestamp as the index of the DataFrame
-        df.set_index('timestamp', inplace=True)
+        # Build the timestamp and renamed column arrays straight from the raw frame,
+        # selecting the valid rows once; no intermediate renamed or copied frame is made.
+        # The key columns are already float32 from the typed read
+        # (float32: values are only charted, and it halves memory traffic)
+        ts = timestamps[keep]
+        arr = {name: df[src].to_numpy(dtype=np.float32)[keep] for src, name in column_mapping.items()}
         print("Data loaded and columns mapped successfully.")
-        return df
+        return ts, arr
 
     def _clean_data(self):
         """Handles missing values."""
@@ -104,70 +217,88 @@ class StockDataProcessor:
         # Data types are now guaranteed to be correct from _load_data.
         # This function now only needs to handle missing values (NaNs).
         
-        # Replace 0s with NaN in price columns, as 0 is not a valid price
+        # Replace 0s with NaN in price columns, as 0 is not a valid price.
+        # Each column is masked in place with a single vectorized pass.
         for col in ['buy_price', 'sell_price']:
-            self.data[col].replace(0, np.nan, inplace=True)
+            prices = self.arr[col]
+            prices[prices == 0] = np.nan
         
         # Forward-fill all missing values (from coercion errors or original NaNs)
-        self.data.ffill(inplace=True)
+        for col, values in self.arr.items():
+            self.arr[col] = self._ffill(values)
         
-        # Drop any remaining NaN rows at the beginning of the dataset
-        self.data.dropna(inplace=True)
+        # Flag the remaining NaN rows at the beginning of the dataset; they are
+        # dropped once, together with the indicator warm-up rows
+        self._valid_mask = np.ones(self.ts.size, dtype=bool)
+        for values in self.arr.values():
+            self._valid_mask &= ~np.isnan(values)
         
-        print(f"Data shape after cleaning: {self.data.shape}")
+        print(f"Data shape after cleaning: {(int(self._valid_mask.sum()), len(self.arr))}")
+
+    @staticmethod
+    def _ffill(values):
+        """Forward-fills NaNs in a 1-D array; leading NaNs are left in place."""
+        last_valid = np.where(np.isnan(values), 0, np.arange(values.size))
+        np.maximum.accumulate(last_valid, out=last_valid)
+        return values[last_valid]
+
+    def _expand_rows(self, values, rows):
+        """Places values computed over a subset of rows back into a full-length NaN column."""
+        column = np.full(self.ts.size, np.nan)
+        column[rows] = values
+        return column
 
     def _calculate_technical_indicators(self):
-        """Calculates and adds various technical indicators to the DataFrame."""
+        """Calculates various technical indicators and adds them as new column arrays."""
         print("Calculating technical indicators...")
         
-        # 1. Price Volatility (Rolling Standard Deviation)
-        self.data['volatility_20_period'] = self.data['last_price'].rolling(window=20).std()
+        # Indicators only run over the rows that survived cleaning; the fancy index
+        # also gives a contiguous price array for the single-pass numba kernels
+        valid_rows = np.flatnonzero(self._valid_mask)
+        prices = self.arr['last_price'][valid_rows]
 
-        # 2. Moving Averages
-        self.data['ma_5_period'] = self.data['last_price'].rolling(window=5).mean()
-        self.data['ma_10_period'] = self.data['last_price'].rolling(window=10).mean()
-        self.data['ma_20_period'] = self.data['last_price'].rolling(window=20).mean()
+        # 1. Price Volatility (Rolling Standard Deviation) and 2. Moving Averages,
+        # all taken from a single pass over the prices
+        ma_5, ma_10, ma_20, std_20 = fused_rolling(prices)
+        self.arr['volatility_20_period'] = self._expand_rows(std_20, valid_rows)
+        self.arr['ma_5_period'] = self._expand_rows(ma_5, valid_rows)
+        self.arr['ma_10_period'] = self._expand_rows(ma_10, valid_rows)
+        self.arr['ma_20_period'] = self._expand_rows(ma_20, valid_rows)
 
         # 3. Volume-Weighted Average Price (VWAP)
-        self.data['price_volume'] = self.data['last_price'] * self.data['total_traded_volume']
-        self.data['cumulative_volume'] = self.data['total_traded_volume'].cumsum()
-        self.data['cumulative_price_volume'] = self.data['price_volume'].cumsum()
+        # Running sums are kept in float64 so they do not lose precision or overflow
+        volume = self.arr['total_traded_volume'][valid_rows].astype(np.float64)
+        cumulative_volume = volume.cumsum()
+        # The running price*volume sum reuses the volume buffer, so no temporaries are allocated
+        cumulative_price_volume = np.cumsum(np.multiply(prices, volume, out=volume), out=volume)
         epsilon = 1e-10  #define epsilon to prevent division by zero
-        self.data['vwap'] = self.data['cumulative_price_volume'] / (self.data['cumulative_volume'] + epsilon)
-        self.data.drop(columns=['price_volume', 'cumulative_price_volume'], inplace=True)
+        self.arr['cumulative_volume'] = self._expand_rows(cumulative_volume, valid_rows)
+        self.arr['vwap'] = self._expand_rows(cumulative_price_volume / (cumulative_volume + epsilon), valid_rows)
 
         # 4. Bid-Ask Spread
-        self.data['bid_ask_spread'] = self.data['sell_price'] - self.data['buy_price']
+        self.arr['bid_ask_spread'] = self.arr['sell_price'] - self.arr['buy_price']
 
         # 5. Market Momentum (RSI - Relative Strength Index)
-        # --- NEW ROBUST IMPLEMENTATION ---
-        # Step A: Create a clean, guaranteed-numeric series for the calculation.
-        price = pd.to_numeric(self.data['last_price'], errors='coerce')
-        
-        # Step B: Calculate price changes (delta).
-        delta = price.diff(1).astype(float)
-        
-        # Step C: Separate gains (positive changes) and losses (absolute negative changes).
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
+        # Average gains and losses use an exponentially weighted moving average (com=13),
+        # computed in one fused pass over the prices.
+        self.arr['rsi_14_period'] = self._expand_rows(rsi_ewm(prices, 13), valid_rows)
 
-        # Step D: Calculate the average gain and loss using an Exponentially Weighted Moving Average.
-        avg_gain = gain.ewm(com=13, adjust=False).mean()
-        avg_loss = loss.ewm(com=13, adjust=False).mean()
-
-        # Step E: Calculate the Relative Strength (RS).
-        # A small epsilon is added to the denominator to prevent division by zero.
-        epsilon = 1e-10
-        rs = avg_gain / (avg_loss + epsilon)
-
-        # Step F: Calculate the RSI.
-        self.data['rsi_14_period'] = 100 - (100 / (1 + rs))
+        # Downcast the derived indicators to float32 to match the tick columns
+        for col in ['volatility_20_period', 'ma_5_period', 'ma_10_period', 'ma_20_period', 'vwap', 'rsi_14_period']:
+            self.arr[col] = self.arr[col].astype(np.float32)
         
         # --- FINAL STEP ---
-        # Drop any rows with NaN values that were created by the rolling calculations.
-        self.data.dropna(inplace=True)
+        # Flag the warm-up rows of the rolling calculations; the 20-period std has the
+        # longest window, so its NaNs cover every other indicator's.
+        self._valid_mask &= ~np.isnan(self.arr['volatility_20_period'])
         print("Technical indicators calculated.")
 
+    def _frame(self, cols=None):
+        """Builds a throwaway DataFrame over the column arrays, indexed by timestamp."""
+        cols = list(self.arr) if cols is None else cols
+        return pd.DataFrame({col: self.arr[col] for col in cols},
+                            index=pd.DatetimeIndex(self.ts, name='timestamp'))
+
     def _perform_statistical_analysis(self):
         """
         Performs statistical analysis on the processed data.
@@ -177,72 +308,173 @@ class StockDataProcessor:
         
         # Daily Price Volatility (Annualized)
         # Resample to daily returns and calculate standard deviation
-        daily_returns = self.data['last_price'].resample('D').last().pct_change()
+        daily_returns = self._frame(['last_price'])['last_price'].resample('D').last().pct_change()
         # Annualize by multiplying by the square root of trading days in a year (approx 252)
         self.summary['daily_volatility'] = daily_returns.std() * np.sqrt(252)
         
         # Trading Volume Patterns
-        self.summary['avg_volume_per_min'] = self.data['total_traded_volume'].resample('1Min').sum().mean()
+        # Mean of the per-minute volume sums, empty minutes included as 0
+        minutes = self.ts_ns // (60 * 10**9)
+        total_volume = self.arr['total_traded_volume'].sum(dtype=np.float64)
+        # NaN when no ticks survive cleaning, like resample().sum().mean() on an empty frame
+        self.summary['avg_volume_per_min'] = total_volume / (minutes.max() - minutes.min() + 1) if minutes.size else np.nan
         
         # Order Flow Imbalance
-        self.data['order_flow_imbalance'] = self.data['buy_quantity'] - self.data['sell_quantity']
-        self.summary['avg_order_flow_imbalance'] = self.data['order_flow_imbalance'].mean()
+        self.arr['order_flow_imbalance'] = self.arr['buy_quantity'] - self.arr['sell_quantity']
+        self.summary['avg_order_flow_imbalance'] = self.arr['order_flow_imbalance'].mean(dtype=np.float64)
 
         # Correlation Analysis - NOTE: 'volatility' column needs to exist
         # Renaming 'volatility_20_period' for the correlation matrix
-        if 'volatility_20_period' in self.data.columns:
-            self.data.rename(columns={'volatility_20_period': 'volatility'}, inplace=True)
-        self.correlation_matrix = self.data[['last_price', 'total_traded_volume', 'bid_ask_spread', 'volatility', 'order_flow_imbalance']].corr()
+        if 'volatility_20_period' in self.arr:
+            self.arr['volatility'] = self.arr.pop('volatility_20_period')
+        self.correlation_matrix = self._frame(['last_price', 'total_traded_volume', 'bid_ask_spread', 'volatility', 'order_flow_imbalance']).corr()
         
         print("Statistical analysis complete.")
 
-    def get_summary(self):
-        """Returns a dictionary of key statistical measures."""
+    def _build_caches(self):
+        """
+        Precomputes the resampled views served by the API.
+        The data is read-only after processing, so each view is built once here
+        and the getters only hand back the cached columns.
+        """
+        print("Building resampled caches...")
+        # Kept so timeframes outside the cached set are bucketed without re-sorting
+        self._ordered = self._time_ordered()
+        ts_ns, ticks = self._ordered
+        self._summary_cache = self._build_summary()
+        # The views are independent, and numpy releases the GIL in its reduction
+        # loops, so they are built concurrently
+        with ThreadPoolExecutor(max_workers=len(TIMEFRAMES) + 2) as executor:
+            ts_futures = {tf: executor.submit(self._build_ohlcv, ts_ns, ticks, tf) for tf in TIMEFRAMES}
+            # The order book and indicator views share one 1-minute grid, so its bucket
+            # numbers and int64 timestamp-seconds column are computed only once
+            minute_grid = self._mean_grid(ts_ns, '1Min')
+            orderbook_future = executor.submit(self._build_orderbook, ticks, minute_grid)
+            indicators_future = executor.submit(self._build_indicators, ticks, minute_grid)
+            self._ts_cache = {tf: future.result() for tf, future in ts_futures.items()}
+            self._orderbook_cache = orderbook_future.result()
+            self._indicators_cache = indicators_future.result()
+        print("Resampled caches built.")
+
+    def _time_ordered(self):
+        """
+        Returns the int64 nanosecond timestamps and column arrays in time order.
+        Ticks normally arrive sorted, in which case the arrays are returned as-is.
+        """
+        ts_ns = self.ts_ns
+        if np.all(ts_ns[1:] >= ts_ns[:-1]):
+            return ts_ns, self.arr
+        # stable, so ticks sharing a timestamp keep their order like pandas' resample
+        order = np.argsort(ts_ns, kind='stable')
+        return ts_ns[order], {col: values[order] for col, values in self.arr.items()}
+
+    @staticmethod
+    def _bucketize(ts_ns, timeframe):
+        """
+        Assigns sorted nanosecond timestamps to fixed-width buckets for a timeframe.
+        Buckets are aligned to midnight of the first day, like pandas' resample.
+        Returns the bucket numbers (starting at 0), the first bucket's start and the width.
+        """
+        width = pd.tseries.frequencies.to_offset(timeframe).nanos
+        origin = ts_ns[0] // DAY_NS * DAY_NS
+        buckets = (ts_ns - origin) // width
+        first = origin + buckets[0] * width
+        return buckets - buckets[0], first, width
+
+    def _build_summary(self):
+        """Builds the dictionary of key statistical measures."""
         return {
-            'total_ticks': int(self.data.shape[0]),
-            'avg_price': float(self.data['last_price'].mean()),
-            'avg_bid_ask_spread': float(self.data['bid_ask_spread'].mean()),
+            'total_ticks': int(self.ts.size),
+            'avg_price': float(self.arr['last_price'].mean(dtype=np.float64)),
+            'avg_bid_ask_spread': float(self.arr['bid_ask_spread'].mean(dtype=np.float64)),
             'daily_volatility_annualized': float(self.summary.get('daily_volatility', 0)),
             'avg_volume_per_min': float(self.summary.get('avg_volume_per_min', 0)),
             'avg_order_flow_imbalance': float(self.summary.get('avg_order_flow_imbalance', 0))
         }
 
-    def get_timeseries_data(self, timeframe='1Min'):
-        """Resamples tick data into OHLCV format for a given timeframe."""
+    def _build_ohlcv(self, ts_ns, ticks, timeframe):
+        """
+        Resamples tick data into OHLCV format for a given timeframe.
+        Bucket boundaries come from the sorted timestamps, so open/close are plain
+        gathers and high/low/volume are reductions over contiguous slices.
+        Only non-empty buckets are returned.
+        """
         # Ensure columns exist before resampling
-        if 'last_price' not in self.data.columns or 'total_traded_volume' not in self.data.columns:
-            return []
-            
-        ohlcv = self.data['last_price'].resample(timeframe).ohlc()
-        volume = self.data['total_traded_volume'].resample(timeframe).sum()
-        
-        ohlcv['volume'] = volume
-        ohlcv.dropna(inplace=True)
-        
-        ohlcv.reset_index(inplace=True)
-        # Convert timestamp to seconds for the charting library
-        ohlcv['timestamp'] = ohlcv['timestamp'].astype(np.int64) // 10**9
-        return ohlcv.to_dict(orient='records')
+        if 'last_price' not in ticks or 'total_traded_volume' not in ticks or ts_ns.size == 0:
+            return {}
 
-    def get_orderbook_analysis(self):
-        """Returns data related to the order book."""
-        cols = ['bid_ask_spread', 'order_flow_imbalance']
-        if not all(c in self.data.columns for c in cols):
-            return []
+        buckets, first, width = self._bucketize(ts_ns, timeframe)
+        starts = np.flatnonzero(np.diff(buckets, prepend=-1))
+        ends = np.append(starts[1:], ts_ns.size)
+        price = ticks['last_price']
+        # Bucket volumes can exceed float32's exact-integer range (2**24), so they stay float64
+        volume = np.add.reduceat(ticks['total_traded_volume'], starts, dtype=np.float64)
+        return {
+            # Convert timestamp to seconds for the charting library
+            'timestamp': (first + buckets[starts] * width) // 10**9,
+            'open': price[starts],
+            'high': np.maximum.reduceat(price, starts),
+            'low': np.minimum.reduceat(price, starts),
+            'close': price[ends - 1],
+            'volume': volume,
+        }
 
-        order_flow_data = self.data[cols].resample('1Min').mean()
-        order_flow_data.reset_index(inplace=True)
-        order_flow_data['timestamp'] = order_flow_data['timestamp'].astype(np.int64) // 10**9
-        return order_flow_data.to_dict(orient='records')
+    def _mean_grid(self, ts_ns, timeframe):
+        """
+        Builds the full bucket grid between the first and last tick for a timeframe:
+        the bucket number of every tick, the tick count per bucket and the bucket
+        start times in seconds (int64, ready for the charting library).
+        """
+        if ts_ns.size == 0:
+            return None
+        buckets, first, width = self._bucketize(ts_ns, timeframe)
+        counts = np.bincount(buckets)
+        timestamps = (first + np.arange(counts.size, dtype=np.int64) * width) // 10**9
+        return buckets, counts, timestamps
 
-    def get_technical_indicators(self):
-        """Returns key technical indicators over time."""
+    @staticmethod
+    def _resample_means(ticks, cols, grid):
+        """
+        Per-bucket means of the given columns over every bucket of the grid;
+        empty buckets are NaN, as with resample().mean().
+        """
+        if grid is None or not all(c in ticks for c in cols):
+            return {}
+
+        buckets, counts, timestamps = grid
+        empty = counts == 0
+        means = {'timestamp': timestamps}
+        for col in cols:
+            sums = np.bincount(buckets, weights=ticks[col])
+            mean = sums / np.where(empty, 1, counts)
+            mean[empty] = np.nan
+            means[col] = mean.astype(np.float32)
+        return means
+
+    def _build_orderbook(self, ticks, grid):
+        """Builds the 1-minute order book view."""
+        return self._resample_means(ticks, ['bid_ask_spread', 'order_flow_imbalance'], grid)
+
+    def _build_indicators(self, ticks, grid):
+        """Builds the 1-minute technical indicators view."""
         cols = ['rsi_14_period', 'ma_5_period', 'ma_10_period', 'ma_20_period', 'vwap']
-        if not all(c in self.data.columns for c in cols):
-            return []
+        return self._resample_means(ticks, cols, grid)
 
-        indicators_data = self.data[cols].resample('1Min').mean()
-        indicators_data.reset_index(inplace=True)
-        indicators_data['timestamp'] = indicators_data['timestamp'].astype(np.int64) // 10**9
-        return indicators_data.to_dict(orient='records')
+    def get_summary(self):
+        """Returns a dictionary of key statistical measures."""
+        return self._summary_cache
 
+    def get_timeseries_data(self, timeframe='1Min'):
+        """Returns OHLCV columns for a given timeframe."""
+        # Timeframes outside the precomputed set are resampled on demand
+        if timeframe not in self._ts_cache:
+            return self._build_ohlcv(*self._ordered, timeframe)
+        return self._ts_cache[timeframe]
+
+    def get_orderbook_analysis(self):
+        """Returns data related to the order book."""
+        return self._orderbook_cache
+
+    def get_technical_indicators(self):
+        """Returns key technical indicators over time."""
+        return self._indicators_cache
@@ -0,0 +1,14 @@
+"""
+Gunicorn settings for serving the ASGI app in api.py:
+    cd data
+    gunicorn api:app
+"""
+import os
+
+bind = '127.0.0.1:5000'
+# Uvicorn's event loop inside each gunicorn worker process
+worker_class = 'uvicorn_worker.UvicornWorker'
+workers = max(2, os.cpu_count() or 1)
+# The StockDataProcessor is built once at import time in the master process;
+# forked workers then share its arrays copy-on-write instead of each rebuilding them.
+preload_app = True
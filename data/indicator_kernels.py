@@ -0,0 +1,119 @@
+"""
+Numba kernels for the technical indicators calculated by StockDataProcessor.
+Each kernel makes a single pass over the price array instead of chaining several
+pandas operations that each allocate and traverse a full-length temporary.
+Numba is optional: without it, vectorized numpy/pandas versions are used instead.
+"""
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _fused_rolling_loop(prices):
+    """
+    5/10/20-period rolling means and the 20-period sample standard deviation (ddof=1)
+    in one pass. Means use running sums; the deviation uses a sliding Welford update.
+    Values are NaN until their window fills.
+    """
+    n = prices.size
+    ma_5 = np.full(n, np.nan)
+    ma_10 = np.full(n, np.nan)
+    ma_20 = np.full(n, np.nan)
+    std_20 = np.full(n, np.nan)
+    sum_5 = 0.0
+    sum_10 = 0.0
+    sum_20 = 0.0
+    mean_20 = 0.0
+    sq_dev_20 = 0.0  # running sum of squared deviations from mean_20
+    for i in range(n):
+        x = prices[i]
+        sum_5 += x
+        sum_10 += x
+        sum_20 += x
+        if i >= 5:
+            sum_5 -= prices[i - 5]
+        if i >= 10:
+            sum_10 -= prices[i - 10]
+        if i < 20:
+            # Grow the window: standard Welford step
+            delta = x - mean_20
+            mean_20 += delta / (i + 1)
+            sq_dev_20 += delta * (x - mean_20)
+        else:
+            # Slide the window: swap the oldest value for the newest one
+            old = prices[i - 20]
+            sum_20 -= old
+            old_mean = mean_20
+            mean_20 += (x - old) / 20
+            sq_dev_20 += (x - old) * (x - mean_20 + old - old_mean)
+        if i >= 4:
+            ma_5[i] = sum_5 / 5
+        if i >= 9:
+            ma_10[i] = sum_10 / 10
+        if i >= 19:
+            ma_20[i] = sum_20 / 20
+            std_20[i] = np.sqrt(max(sq_dev_20, 0.0) / 19)
+    return ma_5, ma_10, ma_20, std_20
+
+def _rsi_ewm_loop(prices, com):
+    """
+    RSI from exponentially weighted average gains and losses.
+    Matches pandas' ewm(com=com, adjust=False) on the gain/loss series, where the
+    first change is taken as 0.
+    """
+    n = prices.size
+    alpha = 1.0 / (1.0 + com)
+    rsi = np.empty(n)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    epsilon = 1e-10  # prevents division by zero
+    for i in range(n):
+        delta = 0.0
+        if i > 0:
+            delta = prices[i] - prices[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        avg_gain = alpha * gain + (1 - alpha) * avg_gain
+        avg_loss = alpha * loss + (1 - alpha) * avg_loss
+        rsi[i] = 100 - (100 / (1 + avg_gain / (avg_loss + epsilon)))
+    return rsi
+
+def _fused_rolling_windows(prices):
+    """
+    Fallback for fused_rolling: each statistic is a vectorized reduction over
+    strided window views of the prices instead of a pandas rolling call.
+    """
+    n = prices.size
+    ma_5 = np.full(n, np.nan)
+    ma_10 = np.full(n, np.nan)
+    ma_20 = np.full(n, np.nan)
+    std_20 = np.full(n, np.nan)
+    if n >= 5:
+        ma_5[4:] = sliding_window_view(prices, 5).mean(axis=1, dtype=np.float64)
+    if n >= 10:
+        ma_10[9:] = sliding_window_view(prices, 10).mean(axis=1, dtype=np.float64)
+    if n >= 20:
+        windows_20 = sliding_window_view(prices, 20)
+        ma_20[19:] = windows_20.mean(axis=1, dtype=np.float64)
+        std_20[19:] = windows_20.std(axis=1, ddof=1, dtype=np.float64)
+    return ma_5, ma_10, ma_20, std_20
+
+def _rsi_ewm_pandas(prices, com):
+    """Fallback for rsi_ewm using pandas' exponentially weighted means."""
+    delta = pd.Series(prices, dtype=np.float64).diff().fillna(0.0)
+    avg_gain = delta.clip(lower=0).ewm(com=com, adjust=False).mean()
+    avg_loss = (-delta).clip(lower=0).ewm(com=com, adjust=False).mean()
+    epsilon = 1e-10  # prevents division by zero
+    return (100 - (100 / (1 + avg_gain / (avg_loss + epsilon)))).to_numpy()
+
+# ~~~~~~ Kernel Selection ~~~~~~
+if njit is not None:
+    fused_rolling = njit(cache=True)(_fused_rolling_loop)
+    rsi_ewm = njit(cache=True)(_rsi_ewm_loop)
+else:
+    fused_rolling = _fused_rolling_windows
+    rsi_ewm = _rsi_ewm_pandas
@@ -4,6 +4,15 @@ import { createChart } from 'lightweight-charts';
 // --- Configuration ---
 const API_BASE_URL = 'http://127.0.0.1:5000';
 
+// --- Helper Functions ---
+
+// Converts the column-major payload sent by the API ({ col: [...] }) into row objects
+const columnsToRows = (columns) => {
+  const keys = Object.keys(columns);
+  if (keys.length === 0) return [];
+  return columns[keys[0]].map((_, i) => Object.fromEntries(keys.map(key => [key, columns[key][i]])));
+};
+
 // --- Helper Components ---
 
 // Displays a single metric card
@@ -235,14 +244,14 @@ function App() {
         const indicators = await indicatorsRes.json();
 
         setSummaryData(summary);
-        setTimeSeriesData(timeseries);
-        setOrderbookData(orderbook);
-        setIndicatorsData(indicators);
+        setTimeSeriesData(columnsToRows(timeseries));
+        setOrderbookData(columnsToRows(orderbook));
+        setIndicatorsData(columnsToRows(indicators));
         setError(null);
 
       } catch (err) {
         console.error("Failed to fetch data:", err);
-        setError("Failed to connect to the backend. Please ensure the Python Flask server is running and accessible.");
+        setError("Failed to connect to the backend. Please ensure the Python API server is running and accessible.");
       } finally {
         setLoading(false);
       }